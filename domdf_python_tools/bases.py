@@ -83,6 +83,10 @@ _V = TypeVar("_V")
 class Dictable(Iterable[Tuple[str, _V]]):
 	"""
 	The basic structure of a class that can be converted into a dictionary.
+
+	Subclasses must implement ``__dict__`` as a property returning the attributes of the class.
+	It is evaluated each time the object is iterated over, copied, pickled or compared,
+	so should avoid doing any expensive work.
 	"""
 
 	@abstractmethod
@@ -100,7 +104,7 @@ class Dictable(Iterable[Tuple[str, _V]]):
 		Iterate over the attributes of the class.
 		"""
 
-		yield from self.__dict__.items()
+		return iter(self.__dict__.items())
 
 	def __getstate__(self) -> Dict[str, _V]:
 		return self.__dict__
@@ -108,6 +112,17 @@ class Dictable(Iterable[Tuple[str, _V]]):
 	def __setstate__(self, state):
 		self.__init__(**state)  # type: ignore[misc]
 
+	def __reduce_ex__(self, protocol):
+		cls = self.__class__
+
+		# Rebuild by calling the constructor directly, rather than creating an empty
+		# instance with ``__new__`` and then calling ``__setstate__``, unless a subclass
+		# customises how it is restored.
+		if cls.__setstate__ is Dictable.__setstate__ and cls.__reduce__ is object.__reduce__:
+			return _rebuild_dictable, (cls, self.__getstate__())
+
+		return super().__reduce_ex__(protocol)
+
 	def __copy__(self):
 		return self.__class__(**self.__dict__)
 
@@ -120,12 +135,19 @@ class Dictable(Iterable[Tuple[str, _V]]):
 		return dict()  # pragma: no cover (abc)
 
 	def __eq__(self, other) -> bool:
-		if isinstance(other, self.__class__):
+		if other.__class__ is self.__class__:
+			return other.__dict__ == self.__dict__
+		elif isinstance(other, self.__class__):
+			# Subclasses may add attributes, so only those of this class need to match.
 			return is_match_with(other.__dict__, self.__dict__)
 
 		return NotImplemented
 
 
+def _rebuild_dictable(cls: Type[Dictable], state: Dict[str, Any]) -> Dictable:
+	return cls(**state)
+
+
 @prettify_docstrings
 class UserList(MutableSequence[_T]):
 	"""
@@ -198,7 +220,10 @@ class UserList(MutableSequence[_T]):
 		return len(self.data)
 
 	def __iter__(self) -> Iterator[_T]:
-		yield from self.data
+		return iter(self.data)
+
+	def __reversed__(self) -> Iterator[_T]:
+		return reversed(self.data)
 
 	@overload
 	def __getitem__(self, i: int) -> _T: ...
@@ -579,13 +604,22 @@ class NamedList(UserList[_T]):
 	.. versionchanged:: 0.10.0
 
 		:class:`~.NamedList` now subclasses :class:`.UserList` rather than :class:`collections.UserList`.
+
+	.. versionchanged:: 3.9.0
+
+		The :class:`str` of the list is now always on a single line,
+		unless :attr:`~.NamedList.pretty` is set to :py:obj:`True`.
 	"""
 
-	def __repr__(self) -> str:
-		return f"{super().__repr__()}"
+	#: If :py:obj:`True` the :class:`str` of the list is formatted with :func:`pprint.pformat`,
+	#: which splits long lists over several lines.
+	pretty: bool = False
 
 	def __str__(self) -> str:
-		return f"{self.__class__.__name__}{pformat(list(self))}"
+		if self.pretty:
+			return f"{self.__class__.__name__}{pformat(self.data)}"
+		else:
+			return f"{self.__class__.__name__}{list(self.data)!r}"
 
 
 def namedlist(name: str = "NamedList") -> Type[NamedList]:
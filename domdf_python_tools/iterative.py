@@ -94,8 +94,17 @@ def chunks(l: Sequence[_T], n: int) -> Iterator[Sequence[_T]]:
 	.. versionchanged:: 1.4.0 Moved from :mod:`domdf_python_tools.utils`
 	"""
 
-	for i in range(0, len(l), n):
+	if n < 1:
+		# Behave as range(0, len(l), n) did: a zero step is an error, a negative one yields nothing.
+		if n == 0:
+			raise ValueError("'n' cannot be 0")
+		return
+
+	i = 0
+	length = len(l)
+	while i < length:
 		yield l[i:i + n]
+		i += n
 
 
 def permutations(data: Iterable[_T], n: int = 2) -> List[Tuple[_T, ...]]:
@@ -117,10 +126,28 @@ def permutations(data: Iterable[_T], n: int = 2) -> List[Tuple[_T, ...]]:
 	if n == 0:
 		raise ValueError("'n' cannot be 0")
 
+	pool = tuple(data)
 	perms = []
-	for i in itertools.permutations(data, n):
-		if i[::-1] not in perms:
-			perms.append(i)
+
+	try:
+		if n == 2 and len(set(pool)) == len(pool):
+			# With no repeated items the kept pairs are exactly the 2-combinations,
+			# which itertools can build without any reverse checks.
+			return list(itertools.combinations(pool, 2))
+
+		# Track the permutations kept so far in a set, so each reverse check is a single lookup.
+		seen = set()
+		for i in itertools.permutations(pool, n):
+			if i[::-1] not in seen:
+				perms.append(i)
+				seen.add(i)
+
+	except TypeError:
+		# The elements are unhashable; fall back to searching the list.
+		perms = []
+		for i in itertools.permutations(pool, n):
+			if i[::-1] not in perms:
+				perms.append(i)
 
 	return perms
 
@@ -46,20 +46,24 @@ Functions for paths and files.
 # stdlib
 import contextlib
 import filecmp
-import fnmatch
+import functools
 import gzip
+import io
 import json
+import locale
 import os
 import pathlib
+import re
 import shutil
 import stat
 import sys
 import tempfile
 import urllib.parse
-from collections import defaultdict, deque
+from collections import defaultdict
 from operator import methodcaller
 from typing import (
 		IO,
+		TYPE_CHECKING,
 		Any,
 		Callable,
 		ContextManager,
@@ -68,7 +72,9 @@ from typing import (
 		Iterator,
 		List,
 		Optional,
+		Pattern,
 		Sequence,
+		Tuple,
 		Type,
 		TypeVar,
 		Union
@@ -140,6 +146,12 @@ A list of directories which will likely be unwanted when searching directory tre
 .. versionchanged:: 3.2.0  Added ``.nox`` (https://nox.thea.codes/)
 """
 
+_EXEC_MASK = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+_WHITESPACE_BEFORE_NEWLINE = re.compile(r"\s\n")
+# O_PATH (Linux) doesn't require read permission on the directory, and fchdir accepts it.
+_CWD_OPEN_FLAGS = getattr(os, "O_PATH", os.O_RDONLY) | getattr(os, "O_DIRECTORY", 0)
+_READ_BYTES_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+
 
 def append(var: str, filename: PathLike, **kwargs) -> int:
 	"""
@@ -153,7 +165,7 @@ def append(var: str, filename: PathLike, **kwargs) -> int:
 
 	kwargs.setdefault("encoding", "UTF-8")
 
-	with open(os.path.join(os.getcwd(), filename), 'a', **kwargs) as f:  # noqa: ENC001
+	with open(filename, 'a', **kwargs) as f:  # noqa: ENC001
 		return f.write(var)
 
 
@@ -162,6 +174,8 @@ def copytree(
 		dst: PathLike,
 		symlinks: bool = False,
 		ignore: Optional[Callable] = None,
+		*,
+		workers: int = 0,
 		) -> PathLike:
 	"""
 	Alternative to :func:`shutil.copytree` to support copying to a directory that already exists.
@@ -190,15 +204,32 @@ def copytree(
 		:func:`shutil.ignore_patterns` can be used to create such a callable
 		that ignores names based on
 		glob-style patterns.
+	:param workers: The number of threads to use to copy the contents of ``src``.
+		If ``0`` the contents are copied one at a time in the current thread.
+
+	.. versionchanged:: 3.9.0  Added the ``workers`` keyword-only argument.
 	"""
 
-	for item in os.listdir(src):
-		s = os.path.join(src, item)
-		d = os.path.join(dst, item)
-		if os.path.isdir(s):
-			shutil.copytree(s, d, symlinks, ignore)
+	with os.scandir(os.fspath(src)) as scandir_it:
+		entries = list(scandir_it)
+
+	def copy_entry(entry: "os.DirEntry[str]") -> None:
+		d = os.path.join(dst, entry.name)
+		if entry.is_dir():
+			shutil.copytree(entry.path, d, symlinks, ignore)
 		else:
-			shutil.copy2(s, d)
+			shutil.copy2(entry.path, d)
+
+	if workers:
+		# stdlib
+		from concurrent.futures import ThreadPoolExecutor
+
+		with ThreadPoolExecutor(max_workers=workers) as executor:
+			for future in [executor.submit(copy_entry, entry) for entry in entries]:
+				future.result()
+	else:
+		for entry in entries:
+			copy_entry(entry)
 
 	return dst
 
@@ -212,7 +243,7 @@ def delete(filename: PathLike, **kwargs):
 	:param filename: The file to delete
 	"""
 
-	os.remove(os.path.join(os.getcwd(), filename), **kwargs)
+	os.remove(filename, **kwargs)
 
 
 def maybe_make(directory: PathLike, mode: int = 0o777, parents: bool = False):
@@ -272,7 +303,7 @@ def read(filename: PathLike, **kwargs) -> str:
 
 	kwargs.setdefault("encoding", "UTF-8")
 
-	with open(os.path.join(os.getcwd(), filename), **kwargs) as f:  # noqa: ENC001
+	with open(filename, **kwargs) as f:  # noqa: ENC001
 		return f.read()
 
 
@@ -318,7 +349,7 @@ def write(var: str, filename: PathLike, **kwargs) -> None:
 
 	kwargs.setdefault("encoding", "UTF-8")
 
-	with open(os.path.join(os.getcwd(), filename), 'w', **kwargs) as f:  # noqa: ENC001
+	with open(filename, 'w', **kwargs) as f:  # noqa: ENC001
 		f.write(var)
 
 
@@ -338,6 +369,24 @@ def clean_writer(string: str, fp: IO) -> None:
 	fp.write(str(buffer))
 
 
+def _clean_lines(lines: Iterable[str]) -> Iterator[str]:
+	# Yields the same text as clean_writer('\n'.join(lines)), one line at a time.
+	# Blank lines are held back until the next line of text, so none are left at the end.
+
+	blank_lines = 0
+
+	for item in lines:
+		for line in item.split('\n'):
+			line = line.rstrip()
+			if line:
+				if blank_lines:
+					yield '\n' * blank_lines
+					blank_lines = 0
+				yield f"{line}\n"
+			else:
+				blank_lines += 1
+
+
 def make_executable(filename: PathLike) -> None:
 	"""
 	Make the given file executable.
@@ -345,11 +394,7 @@ def make_executable(filename: PathLike) -> None:
 	:param filename:
 	"""
 
-	if not isinstance(filename, pathlib.Path):
-		filename = pathlib.Path(filename)
-
-	st = os.stat(str(filename))
-	os.chmod(str(filename), st.st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+	os.chmod(filename, os.stat(filename).st_mode | _EXEC_MASK)
 
 
 @contextlib.contextmanager
@@ -359,14 +404,39 @@ def in_directory(directory: PathLike):
 	duration of the ``with`` block.
 
 	:param directory:
+
+	.. versionchanged:: 3.9.0
+
+		On platforms which support :func:`os.fchdir` the original directory is restored
+		using a file descriptor, so it is restored correctly even if renamed during the ``with`` block.
 	"""  # noqa: D400
 
-	oldwd = os.getcwd()
-	try:
-		os.chdir(str(directory))
-		yield
-	finally:
-		os.chdir(oldwd)
+	fd = None
+
+	if hasattr(os, "fchdir"):  # pragma: no cover (Windows)
+		try:
+			fd = os.open(os.curdir, _CWD_OPEN_FLAGS)
+		except PermissionError:
+			# The current directory can be searched but not read (and O_PATH is unavailable).
+			pass
+
+	if fd is None:
+		oldwd = os.getcwd()
+		try:
+			os.chdir(str(directory))
+			yield
+		finally:
+			os.chdir(oldwd)
+
+	else:  # pragma: no cover (Windows)
+		try:
+			os.chdir(str(directory))
+			yield
+		finally:
+			try:
+				os.fchdir(fd)
+			finally:
+				os.close(fd)
 
 
 class PathPlus(pathlib.Path):
@@ -403,6 +473,17 @@ class PathPlus(pathlib.Path):
 
 		return super().__new__(cls, *args, **kwargs)
 
+	if sys.version_info >= (3, 13):  # pragma: no cover (<py313)
+
+		def _make_child_relpath(self: _PP, name: str) -> _PP:
+			return self.joinpath(name)
+
+	elif TYPE_CHECKING:
+
+		# Provided, untyped, by pathlib before Python 3.13.
+		# It joins a single name without re-parsing the path, which is much faster than ``/``.
+		def _make_child_relpath(self: _PP, name: str) -> _PP: ...
+
 	def make_executable(self) -> None:
 		"""
 		Make the file executable.
@@ -538,7 +619,38 @@ class PathPlus(pathlib.Path):
 
 			self.write_text('\n'.join(data), encoding=encoding, errors=errors)
 		else:
-			self.write_clean('\n'.join(data), encoding=encoding, errors=errors)
+			with self.open('w', encoding=encoding, errors=errors) as fp:
+				fp.writelines(_clean_lines(data))
+
+	def read_bytes(self) -> bytes:
+		"""
+		Open the file in bytes mode, read it, and close the file.
+
+		The file is read with unbuffered system calls, sized from :func:`os.fstat`,
+		rather than through a :class:`io.BufferedReader`.
+
+		.. versionadded:: 3.9.0
+
+		:return: The content of the file.
+		"""
+
+		fd = os.open(self, _READ_BYTES_FLAGS)
+
+		try:
+			# The size only sizes the first read. A short read doesn't mean EOF
+			# (the OS caps single reads at about 2 GiB, and files may grow or,
+			# as for /proc files, report a size of zero), so read until EOF.
+			chunks = [os.read(fd, max(os.fstat(fd).st_size + 1, io.DEFAULT_BUFFER_SIZE))]
+			while True:
+				chunk = os.read(fd, io.DEFAULT_BUFFER_SIZE)
+				if not chunk:
+					break
+				chunks.append(chunk)
+
+		finally:
+			os.close(fd)
+
+		return b''.join(chunks)
 
 	def read_text(
 			self,
@@ -575,7 +687,8 @@ class PathPlus(pathlib.Path):
 		:return: The content of the file.
 		"""  # noqa: D400
 
-		return self.read_text(encoding=encoding, errors=errors).split('\n')
+		with self.open('r', encoding=encoding, errors=errors) as fp:
+			return fp.read().split('\n')
 
 	def open(  # type: ignore  # noqa: A003  # pylint: disable=redefined-builtin
 		self,
@@ -656,18 +769,29 @@ class PathPlus(pathlib.Path):
 			and as a result returns :py:obj:`None` rather than :class:`int`.
 
 		.. versionchanged:: 1.9.0  Added the ``compress`` keyword-only argument.
+		.. versionchanged:: 3.9.0
+
+			Added support for libraries such as `orjson <https://pypi.org/project/orjson/>`_
+			where ``dumps`` returns UTF-8 encoded :class:`bytes`.
 		"""
 
+		content = json_library.dumps(data, **kwargs)
+
+		if isinstance(content, bytes):
+			content = content.decode("UTF-8")
+
 		if compress:
-			with gzip.open(self, mode="wt", encoding=encoding, errors=errors) as fp:
-				fp.write(json_library.dumps(data, **kwargs))
+			encoded = content.encode(encoding or locale.getpreferredencoding(False), errors or "strict")
+			self.write_bytes(gzip.compress(encoded))
 
 		else:
-			self.write_clean(
-					json_library.dumps(data, **kwargs),
-					encoding=encoding,
-					errors=errors,
-					)
+			if not content or _WHITESPACE_BEFORE_NEWLINE.search(content) or content[-1].isspace():
+				self.write_clean(content, encoding=encoding, errors=errors)
+			else:
+				# Already clean, so the result is the same as write_clean without splitting into lines.
+				with self.open('w', encoding=encoding, errors=errors) as fp:
+					fp.write(content)
+					fp.write('\n')
 
 	def load_json(
 			self,
@@ -697,8 +821,10 @@ class PathPlus(pathlib.Path):
 		"""
 
 		if decompress:
-			with gzip.open(self, mode="rt", encoding=encoding, errors=errors) as fp:
-				content = fp.read()
+			content = gzip.decompress(self.read_bytes()).decode(
+					encoding or locale.getpreferredencoding(False),
+					errors or "strict",
+					)
 		else:
 			content = self.read_text(encoding=encoding, errors=errors)
 
@@ -861,28 +987,46 @@ class PathPlus(pathlib.Path):
 		:rtype:
 
 		.. versionchanged:: 2.5.0  Added the ``matchcase`` option.
+		.. versionchanged:: 3.9.0
+
+			``exclude_dirs`` is now only checked against the names of the children,
+			not the parents of the current path object.
+			``matchcase`` is now also applied to files in subdirectories.
 		"""
 
 		if not self.abspath().is_dir():
 			return
 
-		if exclude_dirs is None:
-			exclude_dirs = ()
+		exclude_dirs = frozenset(exclude_dirs or ())
 
 		if match and not os.path.isabs(match) and self.is_absolute():
 			match = (self / match).as_posix()
 
+		# Compile the pattern once for the whole traversal (see matchglob).
+		match_func = None if match is None else _compile_glob(match, matchcase).fullmatch
+
+		# Depth-first walk using a stack of (directory, remaining entries) pairs,
+		# rather than a nested generator for each directory.
+		stack: List[Tuple[_PP, Iterator["os.DirEntry[str]"]]] = [(self, iter(_list_dir(self)))]
+
 		file: _PP
-		for file in self.iterdir():
-			parts = file.parts
-			if any(d in parts for d in exclude_dirs):
-				continue
+		while stack:
+			directory, entries = stack[-1]
+
+			for entry in entries:
+				if entry.name in exclude_dirs:
+					continue
 
-			if match is None or (match is not None and matchglob(file, match, matchcase)):
-				yield file
+				file = directory._make_child_relpath(entry.name)
 
-			if file.is_dir():
-				yield from file.iterchildren(exclude_dirs, match)
+				if match_func is None or match_func(f"{file.as_posix()}/"):
+					yield file
+
+				if entry.is_dir():
+					stack.append((file, iter(_list_dir(file))))
+					break
+			else:
+				stack.pop()
 
 	@classmethod
 	def from_uri(cls: Type[_PP], uri: str) -> _PP:
@@ -1012,6 +1156,12 @@ class WindowsPathPlus(PathPlus, pathlib.PureWindowsPath):
 		raise NotImplementedError("Path.is_mount() is unsupported on this system")
 
 
+def _list_dir(directory: PathLike) -> List["os.DirEntry[str]"]:
+	# Read the whole directory up front so the file descriptor isn't held open while iterating.
+	with os.scandir(os.fspath(directory)) as scandir_it:
+		return list(scandir_it)
+
+
 def traverse_to_file(base_directory: _P, *filename: PathLike, height: int = -1) -> _P:
 	r"""
 	Traverse the parents of the given directory until the desired file is found.
@@ -1026,12 +1176,21 @@ def traverse_to_file(base_directory: _P, *filename: PathLike, height: int = -1)
 	if not filename:
 		raise TypeError("traverse_to_file expected 2 or more arguments, got 1")
 
+	names = [os.fspath(file) for file in filename]
+
 	for level, directory in enumerate((base_directory, *base_directory.parents)):
 		if height > 0 and ((level - 1) > height):
 			break
 
-		for file in filename:
-			if (directory / file).is_file():
+		directory_path = os.fspath(directory)
+
+		for name in names:
+			try:
+				st = os.stat(os.path.join(directory_path, name))
+			except (OSError, ValueError):
+				continue
+
+			if stat.S_ISREG(st.st_mode):
 				return directory
 
 	raise FileNotFoundError(f"'{filename[0]!s}' not found in {base_directory}")
@@ -1045,7 +1204,7 @@ def matchglob(filename: PathLike, pattern: str, matchcase: bool = True) -> bool:
 
 	:param filename:
 	:param pattern: A pattern structured like a filesystem path, where each element consists of the glob syntax.
-		Each element is matched by :mod:`fnmatch`.
+		Each element is matched using the same syntax as :mod:`fnmatch`.
 		The special element ``**`` matches zero or more files or directories.
 	:param matchcase: Whether the filename's case should match the pattern.
 
@@ -1053,59 +1212,134 @@ def matchglob(filename: PathLike, pattern: str, matchcase: bool = True) -> bool:
 
 	.. seealso:: :wikipedia:`Glob (programming)#Syntax` on Wikipedia
 	.. versionchanged:: 2.5.0  Added the ``matchcase`` option.
+	.. versionchanged:: 3.9.0
+
+		The pattern is now compiled to a regular expression, which is cached between calls.
+		``matchcase=False`` now ignores case on all platforms, not just Windows.
 	"""
 
-	match_func = fnmatch.fnmatchcase if matchcase else fnmatch.fnmatch
+	if not isinstance(filename, pathlib.PurePath):
+		filename = pathlib.PurePath(filename)
 
-	filename = PathPlus(filename)
+	return _compile_glob(pattern, matchcase).fullmatch(f"{filename.as_posix()}/") is not None
 
-	pattern_parts = deque(pathlib.PurePath(pattern).parts)
-	filename_parts = deque(filename.parts)
 
-	if not pattern_parts[-1]:
-		pattern_parts.pop()
+_GLOBSTAR = "(?:[^/]*/)*"
 
-	while True:
-		if not pattern_parts and not filename_parts:
-			return True
-		elif not pattern_parts and filename_parts:
-			# Pattern exhausted but still filename elements
-			return False
 
-		pattern_part = pattern_parts.popleft()
+@functools.lru_cache(maxsize=512)
+def _translate_glob_part(part: str) -> str:
+	"""
+	Translate a single element of a glob pattern into a regular expression.
+
+	Unlike :func:`fnmatch.translate` the wildcards never match the path separator.
+
+	:param part:
+	"""
 
-		if pattern_part == "**" and not filename_parts:
-			return True
+	res: List[str] = []
+	i, n = 0, len(part)
+
+	while i < n:
+		char = part[i]
+		i += 1
+
+		if char == '*':
+			if not res or res[-1] != "[^/]*":
+				res.append("[^/]*")
+		elif char == '?':
+			res.append("[^/]")
+		elif char == '[':
+			j = i
+			if j < n and part[j] == '!':
+				j += 1
+			if j < n and part[j] == ']':
+				j += 1
+			while j < n and part[j] != ']':
+				j += 1
+
+			if j >= n:
+				res.append("\\[")
+			else:
+				stuff = part[i:j]
+				i = j + 1
+				negate = stuff.startswith('!')
+				if negate:
+					stuff = stuff[1:]
+				stuff = _translate_glob_set(stuff)
+
+				if not stuff:
+					# All ranges were empty, so nothing can match (or, when negated, anything can).
+					res.append("[^/]" if negate else "(?!)")
+				else:
+					res.append(f"(?!/)[{'^' if negate else ''}{stuff}]")
 		else:
-			filename_part = filename_parts.popleft()
+			res.append(re.escape(char))
 
-		if pattern_part == "**":
-			if not pattern_parts:
-				return True
+	return ''.join(res)
 
-			while pattern_part == "**":
-				if not pattern_parts:
-					return True
 
-				pattern_part = pattern_parts.popleft()
+def _translate_glob_set(stuff: str) -> str:
+	"""
+	Translate the contents of a ``[...]`` glob set into the contents of a regular expression set.
 
-			if pattern_parts and not filename_parts:
-				# Filename must match everything after **
-				return False
+	Ranges are handled as by :func:`fnmatch.translate`: reversed (empty) ranges are dropped,
+	and any other ``-`` is escaped so it can't be read as a set difference.
 
-			if match_func(filename_part, pattern_part):
-				continue
-			else:
-				while not match_func(filename_part, pattern_part):
-					if not filename_parts:
-						return False
+	:param stuff: The contents of the set, without the brackets or a leading ``!``.
+	"""
+
+	if '-' not in stuff:
+		return re.sub(r"([\\\[\]^&~|])", r"\\\1", stuff)
+
+	chunks: List[str] = []
+	start, k = 0, 1
+	while True:
+		k = stuff.find('-', k)
+		if k < 0:
+			break
+		chunks.append(stuff[start:k])
+		start = k + 1
+		k += 3
+
+	chunk = stuff[start:]
+	if chunk:
+		chunks.append(chunk)
+	else:
+		chunks[-1] += '-'
 
-					filename_part = filename_parts.popleft()
+	# Remove empty ranges, which are invalid in regular expressions.
+	for k in range(len(chunks) - 1, 0, -1):
+		if chunks[k - 1][-1] > chunks[k][0]:
+			chunks[k - 1] = chunks[k - 1][:-1] + chunks[k][1:]
+			del chunks[k]
 
-		elif match_func(filename_part, pattern_part):
-			continue
+	# Only the hyphens between chunks form ranges.
+	return '-'.join(re.sub(r"([\\\[\]^&~|-])", r"\\\1", chunk) for chunk in chunks)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str, matchcase: bool = True) -> Pattern[str]:
+	"""
+	Compile a glob pattern, as taken by :func:`~.matchglob`, into a regular expression.
+
+	The returned expression must be matched against the POSIX form of the path followed by a ``/``.
+
+	:param pattern:
+	:param matchcase: Whether the filename's case should match the pattern.
+	"""
+
+	regex: List[str] = []
+
+	for part in pathlib.PurePath(pattern).as_posix().split('/'):
+		if part == "**":
+			# Consecutive ``**`` elements are equivalent to a single one.
+			if not regex or regex[-1] != _GLOBSTAR:
+				regex.append(_GLOBSTAR)
 		else:
-			return False
+			regex.append(f"{_translate_glob_part(part)}/")
+
+	return re.compile(''.join(regex), 0 if matchcase else re.IGNORECASE)
 
 
 class TemporaryPathPlus(tempfile.TemporaryDirectory):
@@ -161,7 +161,7 @@ def list2str(the_list: Iterable[Any], sep: str = ',') -> str:
 	:return: Comma separated string
 	"""
 
-	return sep.join([str(x) for x in the_list])
+	return sep.join(map(str, the_list))
 
 
 def printr(
@@ -243,8 +243,14 @@ def stderr_writer(
 		Previous versions allowed other keywords arguments supported by :func:`print` but they had no effect.
 	"""
 
+	if sep is None:
+		sep = ' '
+	if end is None:
+		end = '\n'
+
+	# Build the output up front so it reaches the stream in a single write.
 	sys.stdout.flush()
-	print(*values, sep=sep, end=end, file=sys.stderr, flush=True)
+	sys.stderr.write(sep.join(map(str, values)) + end)
 	sys.stderr.flush()
 
 
@@ -265,7 +271,23 @@ def str2tuple(input_string: str, sep: str = ',') -> Tuple[int, ...]:
 	:param sep: The separator in the string.
 	"""
 
-	return tuple(int(x) for x in input_string.split(sep))
+	return tuple(map(int, input_string.split(sep)))
+
+
+_TRUTH_VALUES: Dict[str, bool] = {
+		'y': True,
+		"yes": True,
+		't': True,
+		"true": True,
+		"on": True,
+		'1': True,
+		'n': False,
+		"no": False,
+		'f': False,
+		"false": False,
+		"off": False,
+		'0': False,
+		}
 
 
 def strtobool(val: Union[str, int]) -> bool:
@@ -285,15 +307,16 @@ def strtobool(val: Union[str, int]) -> bool:
 		return bool(val)
 
 	val = val.lower()
-	if val in {'y', "yes", 't', "true", "on", '1'}:
-		return True
-	elif val in {'n', "no", 'f', "false", "off", '0'}:
-		return False
-	else:
-		raise ValueError(f"invalid truth value {val!r}")
+	try:
+		return _TRUTH_VALUES[val]
+	except KeyError:
+		raise ValueError(f"invalid truth value {val!r}") from None
 
 
-def enquote_value(value: Any) -> Union[str, bool, float]:
+_ENQUOTE_RESERVED = frozenset({"True", "False", "None"})
+
+
+def enquote_value(value: Any) -> Union[str, bool, float, None]:
 	"""
 	Adds single quotes (``'``) to the given value, suitable for use in a templating system such as Jinja2.
 
@@ -303,11 +326,11 @@ def enquote_value(value: Any) -> Union[str, bool, float]:
 	:param value: The value to enquote
 	"""
 
-	if value in {"True", "False", "None", True, False, None}:
-		return value
-	elif isinstance(value, (int, float)):
+	if value is None or isinstance(value, (int, float)):
 		return value
 	elif isinstance(value, str):
+		if value in _ENQUOTE_RESERVED:
+			return value
 		return repr(value)
 	else:
 		return f"'{value}'"
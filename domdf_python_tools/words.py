@@ -494,6 +494,8 @@ def as_text(value: Any) -> str:
 
 	if value is None:
 		return ''
+	elif type(value) is str:
+		return value
 
 	return str(value)
 
@@ -52,6 +52,21 @@ class Child(Person):
 		return class_dict
 
 
+class Pet(Dictable):
+
+	def __init__(self, name):
+		super().__init__()
+
+		self.pet_name = str(name)
+
+	@property
+	def __dict__(self):
+		return dict(pet_name=self.pet_name)
+
+	def __setstate__(self, state):
+		self.__init__(state["pet_name"])  # type: ignore[misc]
+
+
 @pytest.fixture()
 def alice():
 	return Person("Alice", 20, "IRC Lurker")
@@ -72,6 +87,7 @@ class TestDictable:
 		clone = Person("Dolly", 6, "Sheep")
 
 		assert dolly == clone
+		assert dolly != Person("Dolly", 7, "Sheep")
 
 	def test_iter(self, alice):
 		for key, value in alice:
@@ -84,8 +100,15 @@ class TestDictable:
 		assert copy.deepcopy(alice) == alice
 		assert copy.copy(alice) == copy.copy(alice)
 
-	def test_pickle(self, alice):
-		assert pickle.loads(pickle.dumps(alice)) == alice  # nosec: B101
+	@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+	def test_pickle(self, alice, protocol):
+		assert pickle.loads(pickle.dumps(alice, protocol=protocol)) == alice  # nosec: B101
+
+	@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+	def test_pickle_custom_setstate(self, protocol):
+		# The constructor doesn't accept the keys of ``__dict__``, so ``__setstate__`` must be used.
+		rex = Pet("Rex")
+		assert pickle.loads(pickle.dumps(rex, protocol=protocol)) == rex  # nosec: B101
 
 	def test_vars(self, alice):
 		assert vars(alice) == dict(alice)
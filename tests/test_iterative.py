@@ -56,6 +56,12 @@ def test_chunks():
 	assert isinstance(chunks(list(range(100)), 5), GeneratorType)
 	assert list(chunks(list(range(100)), 5))[0] == [0, 1, 2, 3, 4]
 	assert list(chunks(['a', 'b', 'c'], 1)) == [['a'], ['b'], ['c']]
+	assert list(chunks("abcdefg", 3)) == ["abc", "def", 'g']
+	assert list(chunks([], 3)) == []
+	assert list(chunks([1, 2, 3], -1)) == []
+
+	with pytest.raises(ValueError, match="'n' cannot be 0"):
+		list(chunks([1, 2, 3], 0))
 
 
 def test_permutations():
@@ -111,6 +117,11 @@ def test_permutations():
 	with pytest.raises(ValueError, match="'n' cannot be 0"):
 		permutations(data, 0)
 
+	assert permutations(iter([1, 2, 1]), 2) == [(1, 2), (1, 1), (1, 2)]
+	assert permutations([1], 2) == []
+	assert permutations(range(4), 2) == [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+	assert permutations([[1], [2], [3]], 2) == [([1], [2]), ([1], [3]), ([2], [3])]
+
 
 def test_split_len():
 	assert split_len("Spam Spam Spam Spam Spam Spam Spam Spam ", 5) == ["Spam "] * 8
@@ -47,6 +47,17 @@ class TestNamedList(TestList):
 		assert str(a1) == "NamedList[0, 1, 2, [0, 1, 2, [...], 3], 3]"
 		assert repr(a1) == "[0, 1, 2, [...], 3]"
 
+	def test_pretty(self):
+
+		class PrettyList(self.type2test):  # type: ignore[name-defined]
+			pretty = True
+
+		a1 = self.type2test(range(30))
+		assert str(a1) == f"{self.type2test.__name__}{list(range(30))!r}"
+
+		a2 = PrettyList(range(30))
+		assert str(a2) == "PrettyList[0,\n " + ",\n ".join(map(str, range(1, 30))) + ']'
+
 
 class ShoppingList(NamedList):
 	pass
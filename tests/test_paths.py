@@ -8,6 +8,7 @@ Test functions in paths.py
 
 # stdlib
 import contextlib
+import json
 import os
 import pathlib
 import platform
@@ -360,7 +361,8 @@ def test_instantiate_wrong_platform():
 			paths.WindowsPathPlus()
 
 
-def test_copytree(tmp_pathplus):
+@pytest.mark.parametrize("workers", [0, 4])
+def test_copytree(tmp_pathplus, workers: int):
 	srcdir = tmp_pathplus / "src"
 	srcdir.mkdir()
 
@@ -391,7 +393,7 @@ def test_copytree(tmp_pathplus):
 	destdir = tmp_pathplus / "dest"
 	destdir.mkdir()
 
-	copytree(srcdir, destdir)
+	copytree(srcdir, destdir, workers=workers)
 
 	assert set(os.listdir(srcdir)) == set(os.listdir(destdir))
 
@@ -521,6 +523,9 @@ def test_write_lines(tmp_pathplus):
 	content = tmp_file.read_text()
 	assert content == "this\nis\na\nlist\nof\nwords\nto\nwrite\nto\nthe\nfile\n"
 
+	tmp_file.write_lines(iter(['', "a  ", '', "b\nc ", '', "  "]))
+	assert tmp_file.read_text() == "\na\n\nb\nc\n"
+
 
 def test_write_lines_trailing_whitespace(tmp_pathplus: PathPlus):
 	tmp_file = tmp_pathplus / "test.txt"
@@ -544,6 +549,42 @@ def test_write_lines_trailing_whitespace(tmp_pathplus: PathPlus):
 	assert content == "this   \nis\na\nlist\nof\nwords\nto\nwrite\t\t\t\nto\nthe\nfile\n"
 
 
+def test_read_bytes(tmp_pathplus: PathPlus):
+	tmp_file = tmp_pathplus / "test.bin"
+
+	tmp_file.write_bytes(b'')
+	assert tmp_file.read_bytes() == b''
+
+	contents = bytes(range(256)) * 1000
+	tmp_file.write_bytes(contents)
+	assert tmp_file.read_bytes() == contents
+
+	with pytest.raises(FileNotFoundError):
+		(tmp_pathplus / "missing.bin").read_bytes()
+
+
+def test_read_bytes_short_reads(tmp_pathplus: PathPlus, monkeypatch):
+	tmp_file = tmp_pathplus / "large.bin"
+	contents = os.urandom(1024 * 1024)
+	tmp_file.write_bytes(contents)
+
+	real_read = os.read
+
+	def short_read(fd: int, n: int) -> bytes:
+		# Like the OS capping a single read, never return more than 100 kB at once.
+		return real_read(fd, min(n, 100_000))
+
+	monkeypatch.setattr(os, "read", short_read)
+
+	assert tmp_file.read_bytes() == contents
+
+
+@pytest.mark.skipif(not os.path.isfile("/proc/self/status"), reason="Requires procfs")
+def test_read_bytes_procfs():
+	# procfs files report a size of zero, so must be read until EOF.
+	assert PathPlus("/proc/self/status").read_bytes().startswith(b"Name:")
+
+
 def test_read_lines(tmp_pathplus: PathPlus):
 	tmp_file = tmp_pathplus / "test.txt"
 
@@ -599,6 +640,26 @@ def test_dump_json_gzip(tmpdir):
 	assert tmp_file.load_json(decompress=True) == {"key": "value", "int": 1234, "float": 12.34}
 
 
+class BytesJson:
+	# Mimics orjson, which returns UTF-8 encoded bytes from dumps().
+
+	@staticmethod
+	def dumps(obj, **kwargs) -> bytes:
+		return json.dumps(obj, **kwargs).encode("UTF-8")
+
+	loads = staticmethod(json.loads)
+
+
+def test_dump_json_bytes(tmp_pathplus: PathPlus):
+	tmp_file = tmp_pathplus / "test.txt"
+
+	tmp_file.dump_json({"key": "valüe", "int": 1234}, json_library=BytesJson, ensure_ascii=False)  # type: ignore
+	assert tmp_file.read_text() == '{"key": "valüe", "int": 1234}\n'
+
+	tmp_file.dump_json({"key": "valüe", "int": 1234}, json_library=BytesJson, compress=True)  # type: ignore
+	assert tmp_file.load_json(decompress=True) == {"key": "valüe", "int": 1234}
+
+
 def test_load_json(tmpdir):
 	tmpdir_p = PathPlus(tmpdir)
 
@@ -635,6 +696,56 @@ def test_in_directory(tmp_pathplus: PathPlus):
 	assert os.getcwd() == cwd
 
 
+@not_windows("fchdir is unavailable on Windows")
+def test_in_directory_renamed(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "before").mkdir()
+	(tmp_pathplus / "target").mkdir()
+
+	with in_directory(tmp_pathplus / "before"):
+		with in_directory(tmp_pathplus / "target"):
+			(tmp_pathplus / "before").rename(tmp_pathplus / "after")
+
+		assert os.getcwd() == str(tmp_pathplus / "after")
+
+
+def test_in_directory_unreadable_cwd(tmp_pathplus: PathPlus, monkeypatch):
+	(tmp_pathplus / "before").mkdir()
+	(tmp_pathplus / "target").mkdir()
+
+	real_open = os.open
+
+	def unreadable_open(path, flags, *args, **kwargs):
+		if path == os.curdir:
+			raise PermissionError(13, "Permission denied", path)
+		return real_open(path, flags, *args, **kwargs)
+
+	with in_directory(tmp_pathplus / "before"):
+		monkeypatch.setattr(os, "open", unreadable_open)
+
+		with in_directory(tmp_pathplus / "target"):
+			assert os.getcwd() == str(tmp_pathplus / "target")
+
+		assert os.getcwd() == str(tmp_pathplus / "before")
+
+
+@not_windows("Windows does not support execute-only directories.")
+@pytest.mark.skipif(hasattr(os, "geteuid") and os.geteuid() == 0, reason="root can read any directory")
+def test_in_directory_execute_only_cwd(tmp_pathplus: PathPlus):
+	xonly = tmp_pathplus / "xonly"
+	xonly.mkdir()
+	(tmp_pathplus / "target").mkdir()
+
+	with in_directory(xonly):
+		xonly.chmod(0o311)
+		try:
+			with in_directory(tmp_pathplus / "target"):
+				assert os.getcwd() == str(tmp_pathplus / "target")
+
+			assert os.getcwd() == str(xonly)
+		finally:
+			xonly.chmod(0o755)
+
+
 @pytest.mark.parametrize(
 		"location, expected",
 		[
@@ -650,6 +761,63 @@ def test_traverse_to_file(tmp_pathplus: PathPlus, location: str, expected: str):
 	assert traverse_to_file(tmp_pathplus / "foo" / "bar" / "baz", "foo.yml") == tmp_pathplus / expected
 
 
+def test_traverse_to_file_multiple(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "foo" / "bar" / "baz" / "setup.cfg").mkdir(parents=True)
+	(tmp_pathplus / "foo" / "setup.cfg").touch()
+	(tmp_pathplus / "pyproject.toml").touch()
+
+	base_directory = tmp_pathplus / "foo" / "bar" / "baz"
+	assert traverse_to_file(base_directory, "pyproject.toml", "setup.cfg") == tmp_pathplus / "foo"
+	assert traverse_to_file(base_directory, "pyproject.toml", "tox.ini") == tmp_pathplus
+	assert traverse_to_file(base_directory, "foo/setup.cfg", "tox.ini") == tmp_pathplus
+
+
+def test_traverse_to_file_multiple_case(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "foo" / "bar").mkdir(parents=True)
+	(tmp_pathplus / "foo" / "Setup.cfg").touch()
+	(tmp_pathplus / "setup.cfg").touch()
+
+	base_directory = tmp_pathplus / "foo" / "bar"
+
+	# Several names must be found exactly where a single name would be,
+	# whether or not the filesystem is case sensitive.
+	expected = traverse_to_file(base_directory, "setup.cfg")
+	assert traverse_to_file(base_directory, "setup.cfg", "tox.ini") == expected
+
+
+def test_traverse_to_file_multiple_unlistable(tmp_pathplus: PathPlus, monkeypatch):
+	(tmp_pathplus / "foo" / "bar").mkdir(parents=True)
+	(tmp_pathplus / "foo" / "setup.cfg").touch()
+
+	unlistable = os.fspath(tmp_pathplus / "foo")
+	real_scandir = os.scandir
+
+	def scandir(path):
+		if os.fspath(path) == unlistable:
+			raise PermissionError(13, "Permission denied", path)
+		return real_scandir(path)
+
+	monkeypatch.setattr(os, "scandir", scandir)
+
+	base_directory = tmp_pathplus / "foo" / "bar"
+	assert traverse_to_file(base_directory, "setup.cfg", "tox.ini") == tmp_pathplus / "foo"
+
+
+@not_windows("Windows does not support execute-only directories.")
+@pytest.mark.skipif(hasattr(os, "geteuid") and os.geteuid() == 0, reason="root can list any directory")
+def test_traverse_to_file_multiple_execute_only(tmp_pathplus: PathPlus):
+	xonly = tmp_pathplus / "xonly"
+	(xonly / "deep").mkdir(parents=True)
+	(xonly / "setup.cfg").touch()
+	xonly.chmod(0o311)
+
+	try:
+		assert traverse_to_file(xonly / "deep", "setup.cfg") == xonly
+		assert traverse_to_file(xonly / "deep", "setup.cfg", "tox.ini") == xonly
+	finally:
+		xonly.chmod(0o755)
+
+
 # TODO: height
 
 
@@ -769,6 +937,35 @@ def test_iterchildren_no_exclusions(tmp_pathplus: PathPlus):
 			]
 
 
+def test_iterchildren_from_excluded_dir(tmp_pathplus: PathPlus):
+	venv = tmp_pathplus / "venv"
+	(venv / "src").mkdir(parents=True)
+	(venv / "src" / "foo.py").touch()
+	(venv / ".tox" / "py36").mkdir(parents=True)
+
+	# Only the children are checked against the exclusions, not the parts of the starting path.
+	children = sorted(p.relative_to(venv) for p in venv.iterchildren())
+	assert children == [PathPlus("src"), PathPlus("src/foo.py")]
+
+	children = sorted(p.relative_to(venv) for p in (venv / "src").iterchildren())
+	assert children == [PathPlus("src/foo.py")]
+
+
+def test_iterchildren_matchcase(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "docs" / "source").mkdir(parents=True)
+	(tmp_pathplus / "README.RST").touch()
+	(tmp_pathplus / "docs" / "source" / "Index.RST").touch()
+
+	children = sorted(p.relative_to(tmp_pathplus) for p in tmp_pathplus.iterchildren(match="**/*.rst"))
+	assert children == []
+
+	# matchcase applies to files in subdirectories too.
+	children = sorted(
+			p.relative_to(tmp_pathplus) for p in tmp_pathplus.iterchildren(match="**/*.rst", matchcase=False)
+			)
+	assert children == [PathPlus("README.RST"), PathPlus("docs/source/Index.RST")]
+
+
 @pytest.mark.parametrize(
 		"pattern, filename, match",
 		[
@@ -831,12 +1028,35 @@ def test_iterchildren_no_exclusions(tmp_pathplus: PathPlus):
 				("**/.tox/*", "foo/bar/.tox/build", True),
 				("**/.tox/**", "foo/bar/.tox/build", True),
 				("**/.tox/**", "foo/bar/.tox/build/baz", True),
+				("**/foo/bar.py", "foo/baz/foo/bar.py", True),
+				("foo/*", "foo/bar/baz.py", False),
+				("foo*bar.py", "foo/bar.py", False),
+				("foo?bar.py", "foo/bar.py", False),
+				("foo[!a]bar.py", "foo/bar.py", False),
+				("[z-a]x", 'x', False),
+				("[z-a]x", "zx", False),
+				("[!z-a]x", "zx", True),
+				("[a--]", 'x', False),
+				("[a--]", '-', False),
+				("[a-c-e]", 'b', True),
+				("[a-c-e]", '-', True),
+				("[a-c-e]", 'd', False),
+				("[a-c-e]", 'e', True),
+				("[-a]", '-', True),
+				("[a-]", '-', True),
 				]
 		)
 def test_matchglob(pattern: str, filename: str, match: bool):
 	assert matchglob(filename, pattern) is match
 
 
+def test_matchglob_matchcase():
+	assert matchglob("foo/BAR.py", "foo/bar.py", matchcase=False)
+	assert matchglob("FOO/bar.py", "**/*.PY", matchcase=False)
+	assert not matchglob("foo/BAR.py", "foo/bar.py", matchcase=True)
+	assert not matchglob("foo/BAR.py", "foo/bar.py")
+
+
 pypy_no_symlink = pytest.mark.skipif(
 		condition=PYPY and platform.system() == "Windows",
 		reason="symlink() is not implemented for PyPy on Windows",
@@ -4,6 +4,7 @@ import re
 import sys
 
 # 3rd party
+import pytest
 from coincidence.selectors import not_windows, only_windows
 from faker import Faker
 from faker.providers import bank, company, internet, phone_number, python
@@ -11,12 +12,16 @@ from faker.providers import bank, company, internet, phone_number, python
 # this package
 from domdf_python_tools.terminal import Echo, br, clear, interrupt, overtype
 
-fake = Faker()
-fake.add_provider(internet)
-fake.add_provider(bank)
-fake.add_provider(company)
-fake.add_provider(phone_number)
-fake.add_provider(python)
+
+@pytest.fixture(scope="session")
+def fake() -> Faker:
+	faker = Faker()
+	faker.add_provider(internet)
+	faker.add_provider(bank)
+	faker.add_provider(company)
+	faker.add_provider(phone_number)
+	faker.add_provider(python)
+	return faker
 
 
 def test_br(capsys):
@@ -120,7 +125,7 @@ def test_overtype(capsys):
 	assert stderr == ["Waiting...\rfoo bar"]
 
 
-def test_echo(capsys):
+def test_echo(capsys, fake):
 	with Echo():
 		abc = "a variable"
 		var = 1234
@@ -162,6 +162,17 @@ def test_stderr_writer(obj, expects, capsys):
 	assert re.match(expects, stderr[0])
 
 
+def test_stderr_writer_sep_end(capsys):
+	stderr_writer(1, 'a', 2.5)
+	stderr_writer(1, 'a', sep='-', end='')
+	stderr_writer(sep=None, end=None)
+	stderr_writer()
+
+	captured = capsys.readouterr()
+	assert captured.err == "1 a 2.5\n1-a\n\n"
+	assert captured.out == ''
+
+
 class TestStr2Tuple:
 
 	@pytest.mark.parametrize(
@@ -228,6 +239,10 @@ class TestStrToBool:
 				("False", "False"),
 				("false", "'false'"),
 				("Hello World", "'Hello World'"),
+				(None, None),
+				("None", "None"),
+				("none", "'none'"),
+				([1, 2], "'[1, 2]'"),
 				],
 		)
 def test_enquote_value(obj, expects):